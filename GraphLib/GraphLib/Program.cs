@@ -72,19 +72,26 @@ public class Program {
         var files = GetGraphFiles("grafo_{0}.txt");
         
         PrintSectionHeader("PARTE 1 - GRAFOS NÃO PONDERADOS");
+        if (!FeatureToggles.RunPart1AdjacencyList && !FeatureToggles.RunPart1AdjacencyMatrix)
+            return;
         
-        if (FeatureToggles.RunPart1AdjacencyList) {
-            Console.WriteLine("\n--- ADJACENCY LIST ---");
-            foreach (var file in files) {
-                RunPart1Studies(file, v => new AdjacencyList(v));
+        // Each file is parsed once and both representations are built from the same edge list.
+        foreach (var file in files) {
+            EdgeList edges;
+            try {
+                edges = Graph.LoadEdges(file, weighted: false);
             }
-        }
-        
-        if (FeatureToggles.RunPart1AdjacencyMatrix) {
-            Console.WriteLine("\n--- ADJACENCY MATRIX ---");
-            foreach (var file in files) {
-                RunPart1Studies(file, v => new AdjacencyMatrix(v));
+            catch (Exception ex) {
+                PrintFileHeader(file, "-", "P1");
+                PrintError($"Falha ao carregar: {ex.Message}");
+                continue;
             }
+
+            if (FeatureToggles.RunPart1AdjacencyList)
+                RunPart1Studies(file, edges, v => new AdjacencyList(v));
+            
+            if (FeatureToggles.RunPart1AdjacencyMatrix)
+                RunPart1Studies(file, edges, v => new AdjacencyMatrix(v));
         }
     }
 
@@ -103,15 +110,15 @@ public class Program {
 
     // ========================= PART 1 TESTS =========================
 
-    private static void RunPart1Studies(string filePath, Func<int, IGraphRepresentation> representationFactory) {
+    private static void RunPart1Studies(string filePath, EdgeList edges, Func<int, IGraphRepresentation> representationFactory) {
         var repType = representationFactory(1).GetType().Name;
         PrintFileHeader(filePath, repType, "P1");
         
         try {
             var (graph, memoryUsed) = LoadGraphWithMemoryTracking(
-                filePath,
+                edges,
                 representationFactory,
-                Graph.FromFileUnweighted,
+                Graph.FromEdges,
                 GraphInputOptions.IsDirected
             );
             
@@ -156,8 +163,9 @@ public class Program {
         PrintFileHeader(filePath, "AdjacencyList", "P2");
         
         try {
-            var graph = Graph.FromFileWeighted(
-                filePath,
+            var edges = Graph.LoadEdges(filePath, weighted: true);
+            var graph = Graph.FromEdges(
+                edges,
                 v => new AdjacencyList(v),
                 new GraphLibrary.Algorithms.DijkstraHeapStrategy(),
                 GraphInputOptions.IsDirected);
@@ -167,14 +175,14 @@ public class Program {
                 return;
             }
 
-            ExecuteDijkstraTests(graph, filePath);
+            ExecuteDijkstraTests(graph, edges);
         }
         catch (Exception ex) {
             PrintError($"Falha ao carregar: {ex.Message}");
         }
     }
 
-    private static void ExecuteDijkstraTests(Graph graph, string filePath) {
+    private static void ExecuteDijkstraTests(Graph graph, EdgeList edges) {
         const int startVertex = 10;
         var targetVertices = new[] { 20, 30, 40, 50, 60 };
         
@@ -194,8 +202,8 @@ public class Program {
         }
 
         Console.WriteLine($"\n[Estudo 3.2: Tempo de Execução Dijkstra (k={DijkstraRunCount})]");
-        var timeArray = MeasureDijkstraWithStrategy(filePath, new GraphLibrary.Algorithms.DijkstraArrayStrategy(), DijkstraRunCount);
-        var timeHeap = MeasureDijkstraWithStrategy(filePath, new GraphLibrary.Algorithms.DijkstraHeapStrategy(), DijkstraRunCount);
+        var timeArray = MeasureDijkstraWithStrategy(edges, new GraphLibrary.Algorithms.DijkstraArrayStrategy(), DijkstraRunCount);
+        var timeHeap = MeasureDijkstraWithStrategy(edges, new GraphLibrary.Algorithms.DijkstraHeapStrategy(), DijkstraRunCount);
         
         Console.WriteLine("| Implementação | Tempo Médio |");
         Console.WriteLine(new string('-', 50));
@@ -379,8 +387,8 @@ public class Program {
             var (parentsDfs, _) = graph.DepthFirstSearch(start);
             
             foreach (var target in targetVertices.Where(v => v <= graph.VertexCount)) {
-                var bfsParent = parentsBfs.GetValueOrDefault(target)?.ToString() ?? "N/A";
-                var dfsParent = parentsDfs.GetValueOrDefault(target)?.ToString() ?? "N/A";
+                var bfsParent = parentsBfs[target] == -1 ? "N/A" : parentsBfs[target].ToString();
+                var dfsParent = parentsDfs[target] == -1 ? "N/A" : parentsDfs[target].ToString();
                 Console.WriteLine($"    Start {start} → Target {target}: BFS={bfsParent}, DFS={dfsParent}");
             }
         }
@@ -403,8 +411,8 @@ public class Program {
         
         if (components.Count > 0) {
             Console.WriteLine($"    Count: {components.Count}");
-            Console.WriteLine($"    Largest: {components.First().Count} vertices");
-            Console.WriteLine($"    Smallest: {components.Last().Count} vertices");
+            Console.WriteLine($"    Largest: {components.Sizes[0]} vertices");
+            Console.WriteLine($"    Smallest: {components.Sizes[^1]} vertices");
         } else {
             Console.WriteLine("    No components found");
         }
@@ -422,13 +430,13 @@ public class Program {
 
     private static string MeasureSearchAlgorithm(
         Graph graph, 
-        Action<int, Dictionary<int, int?>, Dictionary<int, int>> searchFunc, 
+        Action<int, int[], int[]> searchFunc, 
         int runs) {
         
         if (graph.VertexCount == 0) return "N/A";
         
-        var parents = new Dictionary<int, int?>(graph.VertexCount);
-        var levels = new Dictionary<int, int>(graph.VertexCount);
+        var parents = new int[graph.VertexCount + 1];
+        var levels = new int[graph.VertexCount + 1];
         var random = new Random(42);
         var stopwatch = new Stopwatch();
         var totalTicks = 0L;
@@ -445,9 +453,9 @@ public class Program {
         return $"{avgMilliseconds:F4} ms";
     }
 
-    private static string MeasureDijkstraWithStrategy(string filePath, GraphLibrary.Algorithms.IDijkstraStrategy strategy, int runs) {
-        var graph = Graph.FromFileWeighted(
-            filePath,
+    private static string MeasureDijkstraWithStrategy(EdgeList edges, GraphLibrary.Algorithms.IDijkstraStrategy strategy, int runs) {
+        var graph = Graph.FromEdges(
+            edges,
             v => new AdjacencyList(v),
             strategy,
             GraphInputOptions.IsDirected);
@@ -514,9 +522,9 @@ public class Program {
     }
 
     private static (Graph graph, long memoryUsed) LoadGraphWithMemoryTracking(
-        string filePath,
+        EdgeList edges,
         Func<int, IGraphRepresentation> representationFactory,
-        Func<string, Func<int, IGraphRepresentation>, IDijkstraStrategy?, bool, Graph> loadFunction,
+        Func<EdgeList, Func<int, IGraphRepresentation>, IDijkstraStrategy?, bool, bool, Graph> loadFunction,
         bool isDirected) {
         
         GC.Collect();
@@ -524,7 +532,7 @@ public class Program {
         GC.Collect();
         
         var memoryBefore = GC.GetTotalMemory(true);
-        var graph = loadFunction(filePath, representationFactory, null, isDirected);
+        var graph = loadFunction(edges, representationFactory, null, isDirected, false);
         var memoryAfter = GC.GetTotalMemory(true);
         
         return (graph, memoryAfter - memoryBefore);
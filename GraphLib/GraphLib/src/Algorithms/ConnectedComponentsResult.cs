@@ -0,0 +1,26 @@
+namespace GraphLibrary.Algorithms;
+
+// Components are numbered by size (descending). Labels[v] is the component of vertex v (1-based, entry 0 unused);
+// the vertices of component i are Vertices[Offsets[i]..Offsets[i + 1]), in ascending order.
+// Graph memoizes this result, so the arrays are only exposed as read-only spans.
+public readonly struct ConnectedComponentsResult {
+    private readonly int[] _sizes;
+    private readonly int[] _labels;
+    private readonly int[] _offsets;
+    private readonly int[] _vertices;
+
+    internal ConnectedComponentsResult(int[] sizes, int[] labels, int[] offsets, int[] vertices) {
+        _sizes = sizes;
+        _labels = labels;
+        _offsets = offsets;
+        _vertices = vertices;
+    }
+
+    public int Count => _sizes.Length;
+    public ReadOnlySpan<int> Sizes => _sizes;
+    public ReadOnlySpan<int> Labels => _labels;
+    public ReadOnlySpan<int> Offsets => _offsets;
+    public ReadOnlySpan<int> Vertices => _vertices;
+
+    public ReadOnlySpan<int> GetVertices(int component) => _vertices.AsSpan(_offsets[component], _sizes[component]);
+}
@@ -0,0 +1,253 @@
+using System.Numerics;
+
+namespace GraphLibrary.Algorithms {
+    // Allocation-free traversal loops over CSR arrays (1-based: row v is targets[offsets[v]..offsets[v + 1])).
+    internal static class TraversalKernels {
+        // Expects every entry of `levels` to be -1. Returns how many vertices were reached;
+        // they are left in frontier[0..count) ordered by level.
+        public static int BreadthFirstSearch(int[] offsets, int[] targets, int startVertex,
+                                             int[] parents, int[] levels, int[] frontier) {
+            levels[startVertex] = 0;
+            parents[startVertex] = -1;
+            frontier[0] = startVertex;
+            var frontierStart = 0;
+            var frontierEnd = 1;
+            var depth = 0;
+
+            // Each level is a contiguous slice of `frontier`; the next level is appended right after it.
+            while (frontierStart < frontierEnd) {
+                depth++;
+                var nextEnd = frontierEnd;
+                for (var i = frontierStart; i < frontierEnd; i++) {
+                    var u = frontier[i];
+                    for (var k = offsets[u]; k < offsets[u + 1]; k++) {
+                        var neighbor = targets[k];
+                        if (levels[neighbor] != -1)
+                            continue;
+
+                        levels[neighbor] = depth;
+                        parents[neighbor] = u;
+                        frontier[nextEnd++] = neighbor;
+                    }
+                }
+                frontierStart = frontierEnd;
+                frontierEnd = nextEnd;
+            }
+            return frontierEnd;
+        }
+
+        // Level-synchronous BFS that stops as soon as `target` is discovered. `visited` must be cleared.
+        // Returns the distance from `startVertex` to `target`, or -1 when it is unreachable.
+        public static int BreadthFirstDistance(int[] offsets, int[] targets, int startVertex, int target,
+                                               bool[] visited, int[] frontier) {
+            if (startVertex == target) return 0;
+
+            visited[startVertex] = true;
+            frontier[0] = startVertex;
+            var frontierStart = 0;
+            var frontierEnd = 1;
+            var depth = 0;
+
+            while (frontierStart < frontierEnd) {
+                depth++;
+                var nextEnd = frontierEnd;
+                for (var i = frontierStart; i < frontierEnd; i++) {
+                    var u = frontier[i];
+                    for (var k = offsets[u]; k < offsets[u + 1]; k++) {
+                        var neighbor = targets[k];
+                        if (visited[neighbor])
+                            continue;
+                        if (neighbor == target)
+                            return depth;
+
+                        visited[neighbor] = true;
+                        frontier[nextEnd++] = neighbor;
+                    }
+                }
+                frontierStart = frontierEnd;
+                frontierEnd = nextEnd;
+            }
+            return -1;
+        }
+
+        // Expects `parents`/`levels` filled with -1; a level of -1 doubles as the unvisited mark. Each vertex is
+        // pushed at most once, so `stack` needs room for every vertex. Rows are sorted, so walking them backwards
+        // leaves the lowest-numbered neighbor on top of the stack.
+        public static void DepthFirstSearch(int[] offsets, int[] targets, int startVertex,
+                                            int[] parents, int[] levels, int[] stack) {
+            var top = 0;
+            stack[top++] = startVertex;
+            levels[startVertex] = 0;
+
+            while (top > 0) {
+                var u = stack[--top];
+                var nextLevel = levels[u] + 1;
+                for (var k = offsets[u + 1] - 1; k >= offsets[u]; k--) {
+                    var neighbor = targets[k];
+                    if (levels[neighbor] != -1)
+                        continue;
+
+                    parents[neighbor] = u;
+                    levels[neighbor] = nextLevel;
+                    stack[top++] = neighbor;
+                }
+            }
+        }
+
+        // Union-find over every stored edge, with path halving and union by rank. Labels are 0-based component ids
+        // numbered by each component's smallest vertex; entry 0 of `labels` is unused. Symmetric rows only need the
+        // u < v half. Returns the number of components.
+        public static int LabelComponents(int[] offsets, int[] targets, int vertexCount, bool isSymmetric,
+                                          int[] labels, int[] parent, byte[] rank) {
+            for (var v = 1; v <= vertexCount; v++) parent[v] = v;
+            Array.Clear(rank);
+
+            for (var u = 1; u <= vertexCount; u++) {
+                for (var k = offsets[u]; k < offsets[u + 1]; k++) {
+                    var v = targets[k];
+                    if (isSymmetric && v <= u)
+                        continue;
+
+                    var rootU = Find(parent, u);
+                    var rootV = Find(parent, v);
+                    if (rootU == rootV)
+                        continue;
+
+                    if (rank[rootU] < rank[rootV]) (rootU, rootV) = (rootV, rootU);
+                    parent[rootV] = rootU;
+                    if (rank[rootU] == rank[rootV]) rank[rootU]++;
+                }
+            }
+
+            Array.Fill(labels, -1);
+            var componentCount = 0;
+            for (var v = 1; v <= vertexCount; v++) {
+                var root = Find(parent, v);
+                if (labels[root] == -1) labels[root] = componentCount++;
+                labels[v] = labels[root];
+            }
+            return componentCount;
+        }
+
+        private static int Find(int[] parent, int v) {
+            while (parent[v] != v) {
+                parent[v] = parent[parent[v]];
+                v = parent[v];
+            }
+            return v;
+        }
+
+        // Same contract as BreadthFirstSearch, but each frontier vertex claims its unreached neighbors a word
+        // at a time: row & ~reached over packed rows (`words` ulongs per row, row u - 1 for vertex u).
+        public static int BitParallelBreadthFirstSearch(ulong[] rows, int words, int startVertex,
+                                                        int[] parents, int[] levels, int[] frontier, ulong[] reached) {
+            Array.Clear(reached);
+            var source = startVertex - 1;
+            reached[source >> 6] = 1UL << (source & 63);
+            levels[startVertex] = 0;
+            parents[startVertex] = -1;
+            frontier[0] = startVertex;
+            var frontierStart = 0;
+            var frontierEnd = 1;
+            var depth = 0;
+
+            while (frontierStart < frontierEnd) {
+                depth++;
+                var nextEnd = frontierEnd;
+                for (var i = frontierStart; i < frontierEnd; i++) {
+                    var u = frontier[i];
+                    var rowStart = (u - 1) * words;
+                    for (var w = 0; w < words; w++) {
+                        var fresh = rows[rowStart + w] & ~reached[w];
+                        if (fresh == 0)
+                            continue;
+
+                        reached[w] |= fresh;
+                        while (fresh != 0) {
+                            var neighbor = (w << 6) + BitOperations.TrailingZeroCount(fresh) + 1;
+                            fresh &= fresh - 1;
+                            levels[neighbor] = depth;
+                            parents[neighbor] = u;
+                            frontier[nextEnd++] = neighbor;
+                        }
+                    }
+                }
+                frontierStart = frontierEnd;
+                frontierEnd = nextEnd;
+            }
+            return frontierEnd;
+        }
+
+        // Bit-parallel BFS over packed adjacency rows (`words` ulongs per row, 0-based vertices).
+        // R(k+1) = R(k) | (F(k) x A): OR the packed rows of the frontier, then mask what was reached.
+        public static int BitParallelEccentricity(ulong[] rows, int words, int source,
+                                                  ulong[] reached, ulong[] frontier, ulong[] next) {
+            Array.Clear(reached);
+            Array.Clear(frontier);
+            reached[source >> 6] = frontier[source >> 6] = 1UL << (source & 63);
+            var depth = 0;
+
+            while (true) {
+                Array.Clear(next);
+                for (var w = 0; w < words; w++) {
+                    var bits = frontier[w];
+                    while (bits != 0) {
+                        var rowStart = ((w << 6) + BitOperations.TrailingZeroCount(bits)) * words;
+                        bits &= bits - 1;
+                        for (var k = 0; k < words; k++) next[k] |= rows[rowStart + k];
+                    }
+                }
+
+                var grew = 0UL;
+                for (var k = 0; k < words; k++) {
+                    next[k] &= ~reached[k];
+                    reached[k] |= next[k];
+                    grew |= next[k];
+                }
+                if (grew == 0) break;
+
+                depth++;
+                (frontier, next) = (next, frontier);
+            }
+            return depth;
+        }
+
+        // Same level expansion as BitParallelEccentricity, stopping on the level whose new bits include `target`
+        // (both 0-based). Returns -1 when the reachable set stops growing first.
+        public static int BitParallelDistance(ulong[] rows, int words, int source, int target,
+                                              ulong[] reached, ulong[] frontier, ulong[] next) {
+            if (source == target) return 0;
+
+            Array.Clear(reached);
+            Array.Clear(frontier);
+            reached[source >> 6] = frontier[source >> 6] = 1UL << (source & 63);
+            var targetWord = target >> 6;
+            var targetBit = 1UL << (target & 63);
+            var depth = 0;
+
+            while (true) {
+                Array.Clear(next);
+                for (var w = 0; w < words; w++) {
+                    var bits = frontier[w];
+                    while (bits != 0) {
+                        var rowStart = ((w << 6) + BitOperations.TrailingZeroCount(bits)) * words;
+                        bits &= bits - 1;
+                        for (var k = 0; k < words; k++) next[k] |= rows[rowStart + k];
+                    }
+                }
+
+                var grew = 0UL;
+                for (var k = 0; k < words; k++) {
+                    next[k] &= ~reached[k];
+                    reached[k] |= next[k];
+                    grew |= next[k];
+                }
+                if (grew == 0) return -1;
+
+                depth++;
+                if ((next[targetWord] & targetBit) != 0) return depth;
+                (frontier, next) = (next, frontier);
+            }
+        }
+    }
+}
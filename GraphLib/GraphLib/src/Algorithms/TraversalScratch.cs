@@ -0,0 +1,23 @@
+namespace GraphLibrary.Algorithms {
+    internal sealed class TraversalScratch {
+        // Levels stays all -1 between traversals; callers reset only the vertices they reached.
+        public int[] Levels { get; }
+        public int[] Parents { get; }
+        public int[] Frontier { get; }
+        public ulong[] Reached { get; }
+        public ulong[] BitFrontier { get; }
+        public ulong[] BitNext { get; }
+
+        public TraversalScratch(int vertexCount) {
+            Levels = new int[vertexCount + 1];
+            Array.Fill(Levels, -1);
+            Parents = new int[vertexCount + 1];
+            Frontier = new int[vertexCount];
+
+            var words = (vertexCount + 63) >> 6;
+            Reached = new ulong[words];
+            BitFrontier = new ulong[words];
+            BitNext = new ulong[words];
+        }
+    }
+}
@@ -0,0 +1,11 @@
+namespace GraphLibrary {
+    // Parsed edge file: edge i is Sources[i] -> Targets[i] with weight Weights[i] (1.0 for unweighted files).
+    // Load once with Graph.LoadEdges and hand to Graph.FromEdges for every representation that needs it.
+    public readonly record struct EdgeList(
+        int VertexCount,
+        int[] Sources,
+        int[] Targets,
+        double[] Weights) {
+        public int Count => Sources.Length;
+    }
+}
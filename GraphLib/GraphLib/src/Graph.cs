@@ -1,16 +1,24 @@
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Globalization;
 using System.Linq;
+using System.Runtime.InteropServices;
 using GraphLibrary.Representations;
 using GraphLibrary.Algorithms;
 
 namespace GraphLibrary {
     public class Graph {
+        private const int MinParallelBatchSize = 8;
+
         private readonly IGraphRepresentation _representation;
         private readonly Func<int, IGraphRepresentation> _representationFactory;
         private readonly IDijkstraStrategy _dijkstraStrategy;
         private readonly bool _isDirected;
-        private List<int> _allDegreesCache;
+        private int[] _allDegreesCache;
+        private CsrAdjacency _csr;
+        private int[] _eccentricities;
+        private ConnectedComponentsResult? _componentsCache;
+        private int? _diameterCache;
         
         private readonly Dictionary<string, int> _vertexStringToInt = new();
         private readonly Dictionary<int, string> _vertexIntToString = new();
@@ -33,7 +41,20 @@ namespace GraphLibrary {
             _isDirected = isDirected;
         }
 
-        private void InvalidateDegreeCache() => _allDegreesCache = null;
+        private CsrAdjacency Csr => _csr ??= CsrAdjacency.FromRepresentation(_representation);
+
+        private void InvalidateCaches() {
+            _allDegreesCache = null;
+            _csr = null;
+            _eccentricities = null;
+            _componentsCache = null;
+            _diameterCache = null;
+        }
+
+        private void FreezeRepresentation() {
+            if (_representation is AdjacencyList list)
+                list.Freeze();
+        }
 
         private void ValidateVertexIndex(int vertex) {
             if (vertex < 1 || vertex > VertexCount)
@@ -47,145 +68,295 @@ namespace GraphLibrary {
             if (weight < 0) HasNegativeWeights = true;
             
             _representation.AddEdge(u, v, weight, _isDirected);
-            InvalidateDegreeCache();
+            InvalidateCaches();
         }
 
         public void AddEdge(int u, int v) {
             AddEdge(u, v, 1.0);
         }
 
+        private void AddEdges(ReadOnlySpan<int> sources, ReadOnlySpan<int> targets, ReadOnlySpan<double> weights, bool trustedUnique) {
+            for (var i = 0; i < sources.Length; i++) {
+                ValidateVertexIndex(sources[i]);
+                ValidateVertexIndex(targets[i]);
+                if (weights[i] < 0) HasNegativeWeights = true;
+            }
+
+            _representation.AddEdges(sources, targets, weights, _isDirected, trustedUnique);
+            InvalidateCaches();
+        }
+
         public IEnumerable<(int neighbor, double weight)> GetNeighbors(int vertex) {
             ValidateVertexIndex(vertex);
             return _representation.GetNeighbors(vertex);
         }
 
-        public (Dictionary<int, int?> Parents, Dictionary<int, int> Levels) BreadthFirstSearch(int startVertex) {
-            var parents = new Dictionary<int, int?>(VertexCount);
-            var levels = new Dictionary<int, int>(VertexCount);
+        public (int[] Parents, int[] Levels) BreadthFirstSearch(int startVertex) {
+            var parents = new int[VertexCount + 1];
+            var levels = new int[VertexCount + 1];
             BreadthFirstSearch(startVertex, parents, levels);
             return (parents, levels);
         }
         
-        internal void BreadthFirstSearch(int startVertex, Dictionary<int, int?> parents, Dictionary<int, int> levels) {
-            parents.Clear();
-            levels.Clear();
-            var queue = new Queue<int>();
+        internal void BreadthFirstSearch(int startVertex, int[] parents, int[] levels) {
+            BreadthFirstSearch(startVertex, parents, levels, new int[VertexCount]);
+        }
 
-            for (var i = 1; i <= VertexCount; i++) levels[i] = -1;
+        private void BreadthFirstSearch(int startVertex, int[] parents, int[] levels, int[] frontier) {
+            ValidateVertexIndex(startVertex);
+            Array.Fill(parents, -1);
+            Array.Fill(levels, -1);
+            ExpandFrontier(startVertex, parents, levels, frontier);
+        }
 
-            levels[startVertex] = 0;
-            parents[startVertex] = null;
-            queue.Enqueue(startVertex);
+        // Packed rows cost O(V/64) words per visited vertex, which beats walking CSR rows once the
+        // average degree exceeds V/64.
+        private bool TryGetDenseMatrix(out AdjacencyMatrix matrix) {
+            matrix = _representation as AdjacencyMatrix;
+            return matrix != null && 2L * matrix.EdgeCount >= (long)matrix.VertexCount * matrix.WordsPerRow;
+        }
 
-            while (queue.Count > 0) {
-                var u = queue.Dequeue();
-                foreach (var (neighbor, _) in _representation.GetNeighbors(u)) {
-                    if (levels[neighbor] != -1) 
-                        continue;
-                    
-                    levels[neighbor] = levels[u] + 1;
-                    parents[neighbor] = u;
-                    queue.Enqueue(neighbor);
-                }
+        private int ExpandFrontier(int startVertex, int[] parents, int[] levels, int[] frontier) {
+            if (TryGetDenseMatrix(out var matrix)) {
+                return TraversalKernels.BitParallelBreadthFirstSearch(
+                    matrix.GetPackedRows(), matrix.WordsPerRow, startVertex,
+                    parents, levels, frontier, new ulong[matrix.WordsPerRow]);
             }
+
+            var csr = Csr;
+            return TraversalKernels.BreadthFirstSearch(csr.Offsets, csr.Targets, startVertex, parents, levels, frontier);
         }
-        
-        public (Dictionary<int, int?> Parents, Dictionary<int, int> Levels) DepthFirstSearch(int startVertex) {
-            var parents = new Dictionary<int, int?>(VertexCount);
-            var levels = new Dictionary<int, int>(VertexCount);
+
+        public (int[] Parents, int[] Levels) DepthFirstSearch(int startVertex) {
+            var parents = new int[VertexCount + 1];
+            var levels = new int[VertexCount + 1];
             DepthFirstSearch(startVertex, parents, levels);
             return (parents, levels);
         }
 
-        internal void DepthFirstSearch(int startVertex, Dictionary<int, int?> parents, Dictionary<int, int> levels) {
-            parents.Clear();
-            levels.Clear();
-            var visited = new HashSet<int>();
-            var stack = new Stack<(int Vertex, int Level)>();
+        internal void DepthFirstSearch(int startVertex, int[] parents, int[] levels) {
+            ValidateVertexIndex(startVertex);
+            Array.Fill(parents, -1);
+            Array.Fill(levels, -1);
 
-            for (var i = 1; i <= VertexCount; i++) levels[i] = -1;
+            var csr = Csr;
+            TraversalKernels.DepthFirstSearch(csr.Offsets, csr.Targets, startVertex, parents, levels, new int[VertexCount]);
+        }
 
-            stack.Push((startVertex, 0));
-            visited.Add(startVertex);
-            parents[startVertex] = null;
-            levels[startVertex] = 0;
+        public int GetDistance(int u, int v) {
+            ValidateVertexIndex(u);
+            ValidateVertexIndex(v);
 
-            while (stack.Count > 0) {
-                var (u, level) = stack.Pop();
-                foreach (var (neighbor, _) in _representation.GetNeighbors(u)) {
-                    if (!visited.Add(neighbor)) 
-                        continue;
-                    
-                    parents[neighbor] = u;
-                    levels[neighbor] = level + 1;
-                    stack.Push((neighbor, level + 1));
-                }
+            if (TryGetDenseMatrix(out var matrix)) {
+                var words = matrix.WordsPerRow;
+                return TraversalKernels.BitParallelDistance(matrix.GetPackedRows(), words, u - 1, v - 1,
+                                                            new ulong[words], new ulong[words], new ulong[words]);
             }
-        }
 
-        public int GetDistance(int u, int v) {
-            var (_, levels) = BreadthFirstSearch(u);
-            return levels.GetValueOrDefault(v, -1);
+            var csr = Csr;
+            return TraversalKernels.BreadthFirstDistance(csr.Offsets, csr.Targets, u, v,
+                                                         new bool[VertexCount + 1], new int[VertexCount]);
         }
 
         public int GetDiameter() {
             if (VertexCount == 0) return 0;
-            var maxDist = 0;
-            var parents = new Dictionary<int, int?>(VertexCount);
-            var levels = new Dictionary<int, int>(VertexCount);
-            for (var i = 1; i <= VertexCount; i++) {
-                BreadthFirstSearch(i, parents, levels);
-                var currentMax = 0;
-                foreach(var level in levels.Values) if(level > currentMax) currentMax = level;
-                if (currentMax > maxDist) maxDist = currentMax;
+            if (_diameterCache.HasValue) return _diameterCache.Value;
+            if (_eccentricities == null) {
+                _eccentricities = new int[VertexCount + 1];
+                Array.Fill(_eccentricities, -1);
             }
+            // Build the lazy traversal structures up front; the eccentricity sweeps below only read them.
+            if (!TryGetDenseMatrix(out _)) _ = Csr;
+
+            _diameterCache = _isDirected ? GetDiameterExhaustive() : GetDiameterIfub(new TraversalScratch(VertexCount));
+            return _diameterCache.Value;
+        }
+
+        // Every source is independent: each worker keeps its own scratch buffers and writes only its own
+        // _eccentricities slots, sharing the CSR/packed rows read-only.
+        private int GetDiameterExhaustive() {
+            var maxDist = 0;
+            var sync = new object();
+            Parallel.For(1, VertexCount + 1,
+                () => (Scratch: new TraversalScratch(VertexCount), Max: 0),
+                (v, _, local) => (local.Scratch, Math.Max(local.Max, GetEccentricity(v, local.Scratch))),
+                local => {
+                    lock (sync) maxDist = Math.Max(maxDist, local.Max);
+                });
             return maxDist;
         }
 
+        private int GetDiameterIfub(TraversalScratch scratch) {
+            var degrees = GetAllDegrees();
+            var scratchPool = new ConcurrentBag<TraversalScratch>();
+            var covered = new bool[VertexCount + 1];
+            var diameter = 0;
+
+            for (var s = 1; s <= VertexCount; s++) {
+                if (covered[s])
+                    continue;
+
+                var count = ExpandFrontier(s, scratch.Parents, scratch.Levels, scratch.Frontier);
+                var center = s;
+                for (var i = 0; i < count; i++) {
+                    var v = scratch.Frontier[i];
+                    covered[v] = true;
+                    scratch.Levels[v] = -1;
+                    if (degrees[v - 1] > degrees[center - 1]) center = v;
+                }
+
+                var componentDiameter = count <= 2 ? count - 1 : GetComponentDiameterIfub(center, scratch, scratchPool);
+                diameter = Math.Max(diameter, componentDiameter);
+            }
+            return diameter;
+        }
+
+        // iFUB (Crescenzi et al.): walk the BFS levels of a high-degree vertex from the fringe inwards.
+        // Once every vertex at level >= i has been swept, no remaining pair can be farther apart than 2(i - 1).
+        private int GetComponentDiameterIfub(int center, TraversalScratch scratch, ConcurrentBag<TraversalScratch> scratchPool) {
+            var count = ExpandFrontier(center, scratch.Parents, scratch.Levels, scratch.Frontier);
+            var order = scratch.Frontier[..count];
+            var orderLevels = new int[count];
+            for (var i = 0; i < count; i++) {
+                orderLevels[i] = scratch.Levels[order[i]];
+                scratch.Levels[order[i]] = -1;
+            }
+
+            var maxLevel = orderLevels[count - 1];
+            var lowerBound = maxLevel;
+            var next = count - 1;
+            for (var level = maxLevel; level > 0; level--) {
+                var batchEnd = next + 1;
+                while (next >= 0 && orderLevels[next] == level) next--;
+                lowerBound = Math.Max(lowerBound, GetMaxEccentricity(order, next + 1, batchEnd, scratch, scratchPool));
+                if (lowerBound >= 2 * (level - 1))
+                    break;
+            }
+            return lowerBound;
+        }
+
+        // Eccentricities within one iFUB level are independent, so large levels are swept in parallel;
+        // each worker borrows its own scratch buffers from the pool and returns them when done.
+        private int GetMaxEccentricity(int[] vertices, int start, int end,
+                                       TraversalScratch scratch, ConcurrentBag<TraversalScratch> scratchPool) {
+            var maxEccentricity = 0;
+            if (end - start < MinParallelBatchSize) {
+                for (var i = start; i < end; i++) {
+                    maxEccentricity = Math.Max(maxEccentricity, GetEccentricity(vertices[i], scratch));
+                }
+                return maxEccentricity;
+            }
+
+            var sync = new object();
+            Parallel.For(start, end,
+                () => (Scratch: scratchPool.TryTake(out var pooled) ? pooled : new TraversalScratch(VertexCount), Max: 0),
+                (i, _, local) => (local.Scratch, Math.Max(local.Max, GetEccentricity(vertices[i], local.Scratch))),
+                local => {
+                    scratchPool.Add(local.Scratch);
+                    lock (sync) maxEccentricity = Math.Max(maxEccentricity, local.Max);
+                });
+            return maxEccentricity;
+        }
+
+        private int GetEccentricity(int vertex, TraversalScratch scratch) {
+            if (_eccentricities[vertex] != -1)
+                return _eccentricities[vertex];
+
+            int eccentricity;
+            if (TryGetDenseMatrix(out var matrix)) {
+                eccentricity = TraversalKernels.BitParallelEccentricity(
+                    matrix.GetPackedRows(), matrix.WordsPerRow, vertex - 1,
+                    scratch.Reached, scratch.BitFrontier, scratch.BitNext);
+            } else {
+                var count = ExpandFrontier(vertex, scratch.Parents, scratch.Levels, scratch.Frontier);
+                eccentricity = scratch.Levels[scratch.Frontier[count - 1]];
+                for (var i = 0; i < count; i++) scratch.Levels[scratch.Frontier[i]] = -1;
+            }
+            return _eccentricities[vertex] = eccentricity;
+        }
+
         public int GetApproximateDiameter() {
             if (VertexCount == 0) return 0;
             var random = new Random();
             var s = random.Next(1, VertexCount + 1);
             var (_, levelsFromS) = BreadthFirstSearch(s);
-            var u = levelsFromS.OrderByDescending(kvp => kvp.Value).First().Key;
+            var u = Array.IndexOf(levelsFromS, levelsFromS.Max());
             var (_, levelsFromU) = BreadthFirstSearch(u);
-            return levelsFromU.Values.Max();
+            return levelsFromU.Max();
         }
 
-        public List<List<int>> GetConnectedComponents() {
-            var components = new List<List<int>>();
-            var visited = new HashSet<int>();
-            for (var i = 1; i <= VertexCount; i++) {
-                if (visited.Add(i)) {
-                    var currentComponent = new List<int>();
-                    var queue = new Queue<int>();
-                    queue.Enqueue(i);
-                    while (queue.Count > 0) {
-                        var u = queue.Dequeue();
-                        currentComponent.Add(u);
-                        foreach (var (v, _) in _representation.GetNeighbors(u))
-                            if (visited.Add(v)) queue.Enqueue(v);
-                    }
-                    components.Add(currentComponent);
-                }
+        public ConnectedComponentsResult GetConnectedComponents() {
+            if (_componentsCache.HasValue) return _componentsCache.Value;
+
+            var csr = Csr;
+            var labels = new int[VertexCount + 1];
+            var componentCount = TraversalKernels.LabelComponents(csr.Offsets, csr.Targets, VertexCount, !_isDirected,
+                                                                  labels, new int[VertexCount + 1], new byte[VertexCount + 1]);
+
+            var sizesByLabel = new int[componentCount];
+            for (var v = 1; v <= VertexCount; v++) sizesByLabel[labels[v]]++;
+
+            // Largest first; equal sizes keep the order of their smallest vertex.
+            var order = new int[componentCount];
+            for (var c = 0; c < componentCount; c++) order[c] = c;
+            Array.Sort(order, (a, b) => sizesByLabel[a] != sizesByLabel[b] ? sizesByLabel[b].CompareTo(sizesByLabel[a]) : a.CompareTo(b));
+
+            var rank = new int[componentCount];
+            var sizes = new int[componentCount];
+            var offsets = new int[componentCount + 1];
+            for (var i = 0; i < componentCount; i++) {
+                rank[order[i]] = i;
+                sizes[i] = sizesByLabel[order[i]];
+                offsets[i + 1] = offsets[i] + sizes[i];
             }
-            return components.OrderByDescending(c => c.Count).ToList();
+
+            var vertices = new int[VertexCount];
+            var cursor = (int[])offsets.Clone();
+            for (var v = 1; v <= VertexCount; v++) {
+                var component = rank[labels[v]];
+                labels[v] = component;
+                vertices[cursor[component]++] = v;
+            }
+
+            _componentsCache = new ConnectedComponentsResult(sizes, labels, offsets, vertices);
+            return _componentsCache.Value;
         }
         
+        private int[] GetAllDegrees() => _allDegreesCache ??= _representation.GetDegrees();
+
         public Dictionary<string, double> GetDegreeMetrics() {
-            if (_allDegreesCache == null) {
-                _allDegreesCache = new List<int>(VertexCount);
-                for (var i = 1; i <= VertexCount; i++) {
-                    _allDegreesCache.Add(_representation.GetNeighbors(i).Count());
-                }
-            }
-            var degrees = _allDegreesCache;
-            if (degrees.Count == 0) 
+            var degrees = GetAllDegrees();
+            if (degrees.Length == 0) 
                 return new Dictionary<string, double> { { "min_degree", 0 }, { "max_degree", 0 }, { "avg_degree", 0 }, { "median_degree", 0 } };
             
-            var sortedDegrees = degrees.OrderBy(d => d).ToList();
-            var median = (sortedDegrees.Count % 2 == 1) ? sortedDegrees[sortedDegrees.Count / 2] : (sortedDegrees[sortedDegrees.Count / 2 - 1] + sortedDegrees[sortedDegrees.Count / 2]) / 2.0;
-            return new Dictionary<string, double> { { "min_degree", degrees.Min() }, { "max_degree", degrees.Max() }, { "avg_degree", degrees.Average() }, { "median_degree", median } };
+            var minDegree = degrees[0];
+            var maxDegree = degrees[0];
+            var degreeSum = 0L;
+            foreach (var degree in degrees) {
+                if (degree < minDegree) minDegree = degree;
+                if (degree > maxDegree) maxDegree = degree;
+                degreeSum += degree;
+            }
+
+            var median = GetMedian(degrees, maxDegree);
+            return new Dictionary<string, double> { { "min_degree", minDegree }, { "max_degree", maxDegree }, { "avg_degree", (double)degreeSum / degrees.Length }, { "median_degree", median } };
+        }
+
+        // Degrees are bounded by maxValue, so a counting pass finds the middle ranks in O(V + maxValue) without sorting.
+        private static double GetMedian(int[] values, int maxValue) {
+            var counts = new int[maxValue + 1];
+            foreach (var value in values) counts[value]++;
+
+            var lowerRank = (values.Length - 1) / 2;
+            var upperRank = values.Length / 2;
+            var lower = -1;
+            var seen = 0;
+            for (var value = 0; value <= maxValue; value++) {
+                seen += counts[value];
+                if (lower == -1 && seen > lowerRank) lower = value;
+                if (seen > upperRank) return (lower + value) / 2.0;
+            }
+            return lower;
         }
 
         public (Dictionary<int, double> Distances, Dictionary<int, int?> Parents) Dijkstra(int startVertex) {
@@ -227,13 +398,22 @@ namespace GraphLibrary {
             var factory = representationFactory ?? _representationFactory;
             var reversed = new Graph(VertexCount, factory, dijkstraStrategy, _isDirected);
 
+            var sources = new List<int>();
+            var targets = new List<int>();
+            var weights = new List<double>();
             for (var u = 1; u <= VertexCount; u++) {
                 foreach (var (neighbor, weight) in _representation.GetNeighbors(u)) {
-                    reversed.AddEdge(neighbor, u, weight);
+                    sources.Add(neighbor);
+                    targets.Add(u);
+                    weights.Add(weight);
                 }
             }
+            // Undirected rows list every edge from both ends, so only directed copies are duplicate-free.
+            reversed.AddEdges(CollectionsMarshal.AsSpan(sources), CollectionsMarshal.AsSpan(targets), CollectionsMarshal.AsSpan(weights),
+                              trustedUnique: _isDirected);
 
             reversed.HasNegativeWeights = HasNegativeWeights;
+            reversed.FreezeRepresentation();
             return reversed;
         }
 
@@ -262,8 +442,11 @@ namespace GraphLibrary {
             distances[startVertex] = 0;
             parents[startVertex] = null;
 
-            var queue = new LinkedList<int>();
-            queue.AddLast(startVertex);
+            // SLF deque as a ring buffer: inQueue keeps each vertex in it at most once, so V + 1 slots never overflow.
+            var queue = new int[VertexCount + 1];
+            var head = 0;
+            var queued = 1;
+            queue[0] = startVertex;
             inQueue[startVertex] = true;
             enqueueCounts[startVertex] = 1;
 
@@ -271,9 +454,10 @@ namespace GraphLibrary {
             var updateCount = 0;
             var lastPassUpdates = 0;
 
-            while (queue.Count > 0 && !hasNegativeCycle) {
-                var u = queue.First.Value;
-                queue.RemoveFirst();
+            while (queued > 0 && !hasNegativeCycle) {
+                var u = queue[head];
+                head = head + 1 == queue.Length ? 0 : head + 1;
+                queued--;
                 inQueue[u] = false;
 
                 var distU = distances[u];
@@ -296,12 +480,14 @@ namespace GraphLibrary {
                                 break;
                             }
 
-                            if (queue.Count > 0 && newDist < distances[queue.First.Value]) {
-                                queue.AddFirst(neighbor);
+                            if (queued > 0 && newDist < distances[queue[head]]) {
+                                head = head == 0 ? queue.Length - 1 : head - 1;
+                                queue[head] = neighbor;
                             }
                             else {
-                                queue.AddLast(neighbor);
+                                queue[(head + queued) % queue.Length] = neighbor;
                             }
+                            queued++;
                             inQueue[neighbor] = true;
                         }
                     }
@@ -309,7 +495,7 @@ namespace GraphLibrary {
 
                 if (!madeUpdate) {
                     lastPassUpdates++;
-                    if (lastPassUpdates > VertexCount && queue.Count == 0) {
+                    if (lastPassUpdates > VertexCount && queued == 0) {
                         break;
                     }
                 } else {
@@ -350,40 +536,90 @@ namespace GraphLibrary {
                                                Func<int, IGraphRepresentation> representationFactory,
                                                IDijkstraStrategy dijkstraStrategy = null,
                                                bool isDirected = false) {
-            var lines = File.ReadAllLines(filePath);
-            if (!int.TryParse(lines.FirstOrDefault(), out var vertexCount))
-                throw new InvalidDataException("A primeira linha deve conter o número de vértices.");
+            return FromFileUnweighted(filePath, representationFactory, dijkstraStrategy, isDirected, trustedUnique: false);
+        }
 
-            var graph = new Graph(vertexCount, representationFactory, dijkstraStrategy, isDirected);
-            foreach (var line in lines.Skip(1)) {
-                var parts = line.Split([' ', '\t'], StringSplitOptions.RemoveEmptyEntries);
-                if (parts.Length == 2 && int.TryParse(parts[0], out var u) && int.TryParse(parts[1], out var v)) {
-                    graph.AddEdge(u, v);
-                }
-            }
-            return graph;
+        public static Graph FromFileUnweighted(string filePath,
+                                               Func<int, IGraphRepresentation> representationFactory,
+                                               IDijkstraStrategy dijkstraStrategy,
+                                               bool isDirected,
+                                               bool trustedUnique) {
+            return FromEdges(LoadEdges(filePath, weighted: false), representationFactory, dijkstraStrategy, isDirected, trustedUnique);
         }
 
         public static Graph FromFileWeighted(string filePath,
                                              Func<int, IGraphRepresentation> representationFactory,
                                              IDijkstraStrategy dijkstraStrategy = null,
                                              bool isDirected = false) {
-            var lines = File.ReadAllLines(filePath);
-            if (!int.TryParse(lines.FirstOrDefault(), out var vertexCount))
+            return FromFileWeighted(filePath, representationFactory, dijkstraStrategy, isDirected, trustedUnique: false);
+        }
+
+        public static Graph FromFileWeighted(string filePath,
+                                             Func<int, IGraphRepresentation> representationFactory,
+                                             IDijkstraStrategy dijkstraStrategy,
+                                             bool isDirected,
+                                             bool trustedUnique) {
+            return FromEdges(LoadEdges(filePath, weighted: true), representationFactory, dijkstraStrategy, isDirected, trustedUnique);
+        }
+
+        // Builds a graph from an already parsed edge list; the arrays are copied into the representation,
+        // so the same EdgeList can feed several graphs.
+        public static Graph FromEdges(EdgeList edges,
+                                      Func<int, IGraphRepresentation> representationFactory,
+                                      IDijkstraStrategy dijkstraStrategy = null,
+                                      bool isDirected = false,
+                                      bool trustedUnique = false) {
+            var graph = new Graph(edges.VertexCount, representationFactory, dijkstraStrategy, isDirected);
+            graph.AddEdges(edges.Sources, edges.Targets, edges.Weights, trustedUnique);
+            graph.FreezeRepresentation();
+            return graph;
+        }
+
+        // Parses "u v" (or "u v w") lines straight from the file text into flat buffers; lines with a
+        // different field count or unparsable fields are skipped, as before.
+        public static EdgeList LoadEdges(string filePath, bool weighted) {
+            var lines = File.ReadAllText(filePath).AsSpan().EnumerateLines();
+            if (!lines.MoveNext() || !int.TryParse(lines.Current, out var vertexCount))
                 throw new InvalidDataException("A primeira linha deve conter o número de vértices.");
 
-            var graph = new Graph(vertexCount, representationFactory, dijkstraStrategy, isDirected);
+            var sources = new List<int>();
+            var targets = new List<int>();
+            var weights = new List<double>();
             var culture = CultureInfo.InvariantCulture;
-            foreach (var line in lines.Skip(1)) {
-                var parts = line.Split([' ', '\t'], StringSplitOptions.RemoveEmptyEntries);
-                if (parts.Length == 3 &&
-                    int.TryParse(parts[0], out var u) &&
-                    int.TryParse(parts[1], out var v) &&
-                    double.TryParse(parts[2], NumberStyles.Float, culture, out var weight)) {
-                    graph.AddEdge(u, v, weight);
-                }
+            var expectedFields = weighted ? 3 : 2;
+            Span<Range> fields = stackalloc Range[4];
+
+            foreach (var line in lines) {
+                if (SplitFields(line, fields) != expectedFields ||
+                    !int.TryParse(line[fields[0]], out var u) ||
+                    !int.TryParse(line[fields[1]], out var v))
+                    continue;
+
+                var weight = 1.0;
+                if (weighted && !double.TryParse(line[fields[2]], NumberStyles.Float, culture, out weight))
+                    continue;
+
+                sources.Add(u);
+                targets.Add(v);
+                weights.Add(weight);
             }
-            return graph;
+            return new EdgeList(vertexCount, sources.ToArray(), targets.ToArray(), weights.ToArray());
+        }
+
+        // Splits on spaces and tabs, dropping empty fields; returns fields.Length + 1 when there are more fields than slots.
+        private static int SplitFields(ReadOnlySpan<char> line, Span<Range> fields) {
+            var count = 0;
+            var i = 0;
+            while (i < line.Length) {
+                while (i < line.Length && (line[i] == ' ' || line[i] == '\t')) i++;
+                if (i == line.Length) break;
+
+                var start = i;
+                while (i < line.Length && line[i] != ' ' && line[i] != '\t') i++;
+                if (count == fields.Length) return count + 1;
+                fields[count++] = start..i;
+            }
+            return count;
         }
     }
 }
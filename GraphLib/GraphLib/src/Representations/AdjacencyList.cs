@@ -3,10 +3,17 @@ using System.Linq;
 
 namespace GraphLibrary.Representations {
     public class AdjacencyList : IGraphRepresentation {
-        private readonly Dictionary<int, Dictionary<int, double>> _adj;
-        
+        private Dictionary<int, Dictionary<int, double>> _adj;
+        private int[] _offsets;
+        private int[] _targets;
+        private double[] _weights;
+
         public int VertexCount { get; }
         public int EdgeCount { get; private set; }
+        public bool IsFrozen => _adj == null;
+
+        internal int[] Offsets => _offsets;
+        internal int[] Targets => _targets;
 
         public AdjacencyList(int vertexCount) {
             VertexCount = vertexCount;
@@ -18,6 +25,8 @@ namespace GraphLibrary.Representations {
         }
 
         public void AddEdge(int u, int v, double weight, bool isDirected) {
+            if (IsFrozen) Thaw();
+
             if (!_adj[u].ContainsKey(v)) {
                 EdgeCount++;
             }
@@ -28,12 +37,150 @@ namespace GraphLibrary.Representations {
             }
         }
 
+        public void AddEdges(ReadOnlySpan<int> sources, ReadOnlySpan<int> targets, ReadOnlySpan<double> weights,
+                             bool isDirected, bool trustedUnique) {
+            if (EdgeCount > 0) {
+                for (var i = 0; i < sources.Length; i++) {
+                    AddEdge(sources[i], targets[i], weights[i], isDirected);
+                }
+                return;
+            }
+            BuildFrozen(sources, targets, weights, isDirected, trustedUnique);
+        }
+
         public IEnumerable<(int vertex, double weight)> GetNeighbors(int v) {
+            if (IsFrozen) {
+                if (v < 1 || v > VertexCount) yield break;
+                for (var k = _offsets[v]; k < _offsets[v + 1]; k++) {
+                    yield return (_targets[k], _weights[k]);
+                }
+                yield break;
+            }
+
             if (_adj.TryGetValue(v, out var neighbors)) {
                 foreach (var kvp in neighbors) {
                     yield return (kvp.Key, kvp.Value);
                 }
             }
         }
+
+        public int[] GetDegrees() {
+            var degrees = new int[VertexCount];
+            for (var v = 1; v <= VertexCount; v++) {
+                degrees[v - 1] = IsFrozen ? _offsets[v + 1] - _offsets[v] : _adj[v].Count;
+            }
+            return degrees;
+        }
+
+        // Packs the neighbor dictionaries into CSR arrays (1-based: row v is [_offsets[v], _offsets[v + 1])),
+        // each row sorted by neighbor id. A later AddEdge thaws the list back into dictionaries.
+        public void Freeze() {
+            if (IsFrozen) return;
+
+            _offsets = new int[VertexCount + 2];
+            var total = 0;
+            for (var v = 1; v <= VertexCount; v++) {
+                _offsets[v] = total;
+                total += _adj[v].Count;
+            }
+            _offsets[VertexCount + 1] = total;
+
+            _targets = new int[total];
+            _weights = new double[total];
+            var k = 0;
+            for (var v = 1; v <= VertexCount; v++) {
+                foreach (var kvp in _adj[v]) {
+                    _targets[k] = kvp.Key;
+                    _weights[k++] = kvp.Value;
+                }
+                Array.Sort(_targets, _weights, _offsets[v], k - _offsets[v]);
+            }
+            _adj = null;
+        }
+
+        // Builds the frozen rows straight from the edge arrays: a counting sort by source, then (unless the input
+        // is trusted) one pass per row that keeps a repeated neighbor once with the last weight written to it,
+        // exactly like repeated AddEdge calls.
+        private void BuildFrozen(ReadOnlySpan<int> sources, ReadOnlySpan<int> targets, ReadOnlySpan<double> weights,
+                                 bool isDirected, bool trustedUnique) {
+            var offsets = new int[VertexCount + 2];
+            for (var i = 0; i < sources.Length; i++) {
+                offsets[sources[i] + 1]++;
+                if (!isDirected && sources[i] != targets[i]) offsets[targets[i] + 1]++;
+            }
+            for (var v = 1; v <= VertexCount; v++) offsets[v + 1] += offsets[v];
+
+            var rowTargets = new int[offsets[VertexCount + 1]];
+            var rowWeights = new double[rowTargets.Length];
+            var cursor = (int[])offsets.Clone();
+            for (var i = 0; i < sources.Length; i++) {
+                var (u, v, weight) = (sources[i], targets[i], weights[i]);
+                rowTargets[cursor[u]] = v;
+                rowWeights[cursor[u]++] = weight;
+                if (!isDirected && u != v) {
+                    rowTargets[cursor[v]] = u;
+                    rowWeights[cursor[v]++] = weight;
+                }
+            }
+
+            if (trustedUnique) {
+                for (var u = 1; u <= VertexCount; u++) {
+                    Array.Sort(rowTargets, rowWeights, offsets[u], offsets[u + 1] - offsets[u]);
+                }
+                _offsets = offsets;
+                _targets = rowTargets;
+                _weights = rowWeights;
+                _adj = null;
+                EdgeCount = sources.Length;
+                return;
+            }
+
+            var lastRow = new int[VertexCount + 1];
+            var slot = new int[VertexCount + 1];
+            var write = 0;
+            var selfLoops = 0;
+            for (var u = 1; u <= VertexCount; u++) {
+                var end = offsets[u + 1];
+                var start = offsets[u];
+                offsets[u] = write;
+                for (var k = start; k < end; k++) {
+                    var neighbor = rowTargets[k];
+                    if (lastRow[neighbor] == u) {
+                        rowWeights[slot[neighbor]] = rowWeights[k];
+                        continue;
+                    }
+
+                    lastRow[neighbor] = u;
+                    slot[neighbor] = write;
+                    if (neighbor == u) selfLoops++;
+                    rowTargets[write] = neighbor;
+                    rowWeights[write++] = rowWeights[k];
+                }
+                Array.Sort(rowTargets, rowWeights, offsets[u], write - offsets[u]);
+            }
+            offsets[VertexCount + 1] = write;
+
+            Array.Resize(ref rowTargets, write);
+            Array.Resize(ref rowWeights, write);
+            _offsets = offsets;
+            _targets = rowTargets;
+            _weights = rowWeights;
+            _adj = null;
+            EdgeCount = isDirected ? write : (write + selfLoops) / 2;
+        }
+
+        private void Thaw() {
+            _adj = new Dictionary<int, Dictionary<int, double>>(VertexCount);
+            for (var v = 1; v <= VertexCount; v++) {
+                var neighbors = new Dictionary<int, double>(_offsets[v + 1] - _offsets[v]);
+                for (var k = _offsets[v]; k < _offsets[v + 1]; k++) {
+                    neighbors[_targets[k]] = _weights[k];
+                }
+                _adj[v] = neighbors;
+            }
+            _offsets = null;
+            _targets = null;
+            _weights = null;
+        }
     }
-}
\ No newline at end of file
+}
@@ -1,44 +1,185 @@
 using System.Collections.Generic;
+using System.Numerics;
 
 namespace GraphLibrary.Representations {
     public class AdjacencyMatrix : IGraphRepresentation {
-        private readonly double[,] _matrix;
+        // Weights are allocated on the first edge, once its direction is known. Undirected edges are stored once,
+        // in the upper triangle (diagonal included) flattened row by row; directed edges need the full V x V matrix,
+        // and a triangle that later receives a directed edge is promoted to it.
+        private double[] _upper;
+        private double[,] _matrix;
         private const double NoEdge = double.PositiveInfinity;
+        private readonly ulong[] _packedRows;
+        private int[] _rowOffsets;
+        private int[] _rowTargets;
+        private double[] _rowWeights;
 
         public int VertexCount { get; }
         public int EdgeCount { get; private set; }
+        internal int WordsPerRow => (VertexCount + 63) >> 6;
 
         public AdjacencyMatrix(int vertexCount) {
             VertexCount = vertexCount;
             EdgeCount = 0;
-            _matrix = new double[vertexCount, vertexCount];
-            for (var i = 0; i < vertexCount; i++) {
-                for (var j = 0; j < vertexCount; j++) {
-                    _matrix[i, j] = NoEdge;
-                }
-            }
+            _packedRows = new ulong[vertexCount * WordsPerRow];
         }
 
         public void AddEdge(int u, int v, double weight, bool isDirected) {
             var uIdx = u - 1;
             var vIdx = v - 1;
 
-            if (_matrix[uIdx, vIdx] == NoEdge) {
+            EnsureStorage(isDirected);
+            if (GetWeight(uIdx, vIdx) == NoEdge) {
                 EdgeCount++;
             }
-            _matrix[uIdx, vIdx] = weight;
+            SetWeight(uIdx, vIdx, weight, isDirected);
+            _packedRows[uIdx * WordsPerRow + (vIdx >> 6)] |= 1UL << (vIdx & 63);
 
             if (!isDirected) {
-                _matrix[vIdx, uIdx] = weight;
+                _packedRows[vIdx * WordsPerRow + (uIdx >> 6)] |= 1UL << (uIdx & 63);
             }
+            _rowOffsets = null;
         }
 
-        public IEnumerable<(int vertex, double weight)> GetNeighbors(int v) {
-            var vIdx = v - 1;
+        public void AddEdges(ReadOnlySpan<int> sources, ReadOnlySpan<int> targets, ReadOnlySpan<double> weights,
+                             bool isDirected, bool trustedUnique) {
+            if (!trustedUnique) {
+                for (var i = 0; i < sources.Length; i++) {
+                    AddEdge(sources[i], targets[i], weights[i], isDirected);
+                }
+                return;
+            }
+
+            EnsureStorage(isDirected);
+            var words = WordsPerRow;
+            for (var i = 0; i < sources.Length; i++) {
+                var uIdx = sources[i] - 1;
+                var vIdx = targets[i] - 1;
+                SetWeight(uIdx, vIdx, weights[i], isDirected);
+                _packedRows[uIdx * words + (vIdx >> 6)] |= 1UL << (vIdx & 63);
+                if (!isDirected) {
+                    _packedRows[vIdx * words + (uIdx >> 6)] |= 1UL << (uIdx & 63);
+                }
+            }
+            EdgeCount += sources.Length;
+            _rowOffsets = null;
+        }
+
+        private long UpperIndex(int i, int j) {
+            if (i > j) (i, j) = (j, i);
+            return (long)i * (2L * VertexCount - i + 1) / 2 + (j - i);
+        }
+
+        private double GetWeight(int i, int j) {
+            if (_matrix != null) return _matrix[i, j];
+            return _upper != null ? _upper[UpperIndex(i, j)] : NoEdge;
+        }
+
+        private void SetWeight(int i, int j, double weight, bool isDirected) {
+            if (_matrix == null) {
+                _upper[UpperIndex(i, j)] = weight;
+                return;
+            }
+
+            _matrix[i, j] = weight;
+            if (!isDirected) _matrix[j, i] = weight;
+        }
+
+        private void EnsureStorage(bool isDirected) {
+            if (_matrix != null)
+                return;
+            if (!isDirected) {
+                if (_upper == null) {
+                    _upper = new double[(long)VertexCount * (VertexCount + 1) / 2];
+                    Array.Fill(_upper, NoEdge);
+                }
+                return;
+            }
+
+            var matrix = new double[VertexCount, VertexCount];
+            if (_upper == null) {
+                for (var i = 0; i < VertexCount; i++) {
+                    for (var j = 0; j < VertexCount; j++) {
+                        matrix[i, j] = NoEdge;
+                    }
+                }
+            } else {
+                var k = 0L;
+                for (var i = 0; i < VertexCount; i++) {
+                    for (var j = i; j < VertexCount; j++) {
+                        matrix[i, j] = matrix[j, i] = _upper[k++];
+                    }
+                }
+            }
+            _matrix = matrix;
+            _upper = null;
+        }
+
+        // One bit per cell, WordsPerRow ulongs per row (0-based), kept in sync by AddEdge.
+        internal ulong[] GetPackedRows() => _packedRows;
+
+        public int[] GetDegrees() {
+            var words = WordsPerRow;
+            var degrees = new int[VertexCount];
             for (var i = 0; i < VertexCount; i++) {
-                var weight = _matrix[vIdx, i];
-                if (weight != NoEdge)
-                    yield return (i + 1, weight);
+                var rowStart = i * words;
+                var degree = 0;
+                for (var w = 0; w < words; w++) {
+                    degree += BitOperations.PopCount(_packedRows[rowStart + w]);
+                }
+                degrees[i] = degree;
+            }
+            return degrees;
+        }
+
+        // Row-compressed copy of the matrix (1-based: row v is [offsets[v], offsets[v + 1])), rebuilt after AddEdge.
+        internal (int[] Offsets, int[] Targets) GetRows() {
+            EnsureRows();
+            return (_rowOffsets, _rowTargets);
+        }
+
+        // Neighbors are read off the packed bits, so the scan costs O(V²/64) words plus one weight lookup per edge.
+        private void EnsureRows() {
+            if (_rowOffsets != null)
+                return;
+
+            var words = WordsPerRow;
+            var degrees = GetDegrees();
+            var offsets = new int[VertexCount + 2];
+            for (var i = 0; i < VertexCount; i++) {
+                offsets[i + 2] = offsets[i + 1] + degrees[i];
+            }
+
+            var targets = new int[offsets[VertexCount + 1]];
+            var weights = new double[targets.Length];
+            var k = 0;
+            for (var i = 0; i < VertexCount; i++) {
+                var rowStart = i * words;
+                for (var w = 0; w < words; w++) {
+                    var bits = _packedRows[rowStart + w];
+                    while (bits != 0) {
+                        var j = (w << 6) + BitOperations.TrailingZeroCount(bits);
+                        bits &= bits - 1;
+                        targets[k] = j + 1;
+                        weights[k++] = GetWeight(i, j);
+                    }
+                }
+            }
+
+            _rowTargets = targets;
+            _rowWeights = weights;
+            _rowOffsets = offsets;
+        }
+
+        public IEnumerable<(int vertex, double weight)> GetNeighbors(int v) {
+            if (v < 1 || v > VertexCount) yield break;
+
+            EnsureRows();
+            var end = _rowOffsets[v + 1];
+            var targets = _rowTargets;
+            var weights = _rowWeights;
+            for (var k = _rowOffsets[v]; k < end; k++) {
+                yield return (targets[k], weights[k]);
             }
         }
     }
@@ -0,0 +1,43 @@
+using System.Collections.Generic;
+
+namespace GraphLibrary.Representations {
+    internal sealed class CsrAdjacency {
+        // 1-based vertices: neighbors of v live in Targets[Offsets[v]..Offsets[v + 1]), sorted ascending.
+        public int[] Offsets { get; }
+        public int[] Targets { get; }
+        public int VertexCount { get; }
+
+        private CsrAdjacency(int vertexCount, int[] offsets, int[] targets) {
+            VertexCount = vertexCount;
+            Offsets = offsets;
+            Targets = targets;
+        }
+
+        public static CsrAdjacency FromRepresentation(IGraphRepresentation representation) {
+            var vertexCount = representation.VertexCount;
+            if (representation is AdjacencyList { IsFrozen: true } frozen)
+                return new CsrAdjacency(vertexCount, frozen.Offsets, frozen.Targets);
+            if (representation is AdjacencyMatrix matrix) {
+                var (rowOffsets, rowTargets) = matrix.GetRows();
+                return new CsrAdjacency(vertexCount, rowOffsets, rowTargets);
+            }
+
+            var offsets = new int[vertexCount + 2];
+            var targets = new List<int>(representation.EdgeCount);
+
+            for (var u = 1; u <= vertexCount; u++) {
+                offsets[u] = targets.Count;
+                foreach (var (neighbor, _) in representation.GetNeighbors(u)) {
+                    targets.Add(neighbor);
+                }
+            }
+            offsets[vertexCount + 1] = targets.Count;
+
+            var packed = targets.ToArray();
+            for (var u = 1; u <= vertexCount; u++) {
+                Array.Sort(packed, offsets[u], offsets[u + 1] - offsets[u]);
+            }
+            return new CsrAdjacency(vertexCount, offsets, packed);
+        }
+    }
+}
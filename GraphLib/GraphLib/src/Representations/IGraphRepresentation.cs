@@ -7,6 +7,13 @@ namespace GraphLibrary.Representations {
         
         void AddEdge(int u, int v, double weight, bool isDirected);
 
+        // With trustedUnique the caller guarantees no edge repeats (in either direction when undirected),
+        // so duplicate detection is skipped and every input edge counts once.
+        void AddEdges(ReadOnlySpan<int> sources, ReadOnlySpan<int> targets, ReadOnlySpan<double> weights,
+                      bool isDirected, bool trustedUnique);
+
         IEnumerable<(int vertex, double weight)> GetNeighbors(int v);
+
+        int[] GetDegrees();
     }
 }
\ No newline at end of file